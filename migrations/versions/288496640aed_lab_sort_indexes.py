@@ -0,0 +1,31 @@
+"""
+lab sort indexes
+
+Revision ID: 288496640aed
+Revises: b524ac60c9c5
+Create Date: 2026-10-16 10:12:31.402518
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '288496640aed'
+down_revision = 'b524ac60c9c5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_lab_cluster_event_cluster_id_date', 'lab_cluster_event',
+                    ['cluster_id', 'date', 'id'], unique=False)
+    op.create_index('ix_lab_cluster_reservation_expiration', 'lab_cluster',
+                    ['reservation_expiration', 'id'], unique=False)
+    op.create_index('ix_lab_cluster_lifespan_expiration', 'lab_cluster',
+                    ['lifespan_expiration', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_lab_cluster_lifespan_expiration', table_name='lab_cluster')
+    op.drop_index('ix_lab_cluster_reservation_expiration', table_name='lab_cluster')
+    op.drop_index('ix_lab_cluster_event_cluster_id_date', table_name='lab_cluster_event')
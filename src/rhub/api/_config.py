@@ -44,6 +44,15 @@ SQLALCHEMY_DATABASE_URI = (
 )
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 SQLALCHEMY_ECHO = os.getenv('SQLALCHEMY_ECHO', 'false').lower() == 'true'
+SQLALCHEMY_ENGINE_OPTIONS = {
+    # Size of the compiled SQL statements cache (default 500). API endpoints
+    # with many optional filters, like cluster list, produce many statement
+    # variants that would otherwise evict each other from the cache.
+    'query_cache_size': int(os.getenv('SQLALCHEMY_QUERY_CACHE_SIZE', '1200')),
+}
+# Raise an error when API endpoints lazy load relationships that should be
+# eager loaded, useful in development to catch N+1 queries.
+RHUB_STRICT_LOADS = os.getenv('RHUB_STRICT_LOADS', 'false').lower() == 'true'
 
 VAULT_TYPE = os.getenv('VAULT_TYPE')
 # hashicorp vault variables
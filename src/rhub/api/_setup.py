@@ -71,6 +71,21 @@ def setup():
             job_params=None,
         )
     )
+    create_cronjob(
+        scheduler_model.SchedulerCronJob(
+            name='Fail stale queued clusters',
+            description=(
+                'Mark clusters whose creation was not launched in Tower as '
+                'failed, so they can be deleted.'
+            ),
+            enabled=True,
+            time_expr='*/15 * * * *',  # every 15 minutes
+            job_name=scheduler_jobs.fail_stale_queued_clusters.name,
+            job_params={
+                'queued_timeout': 60,
+            },
+        )
+    )
     create_cronjob(
         scheduler_model.SchedulerCronJob(
             name='Update LDAP users and groups',
@@ -1,16 +1,22 @@
-import functools
+import concurrent.futures
+import datetime
 import logging
+import operator
+import re
 
 import sqlalchemy
 from connexion import problem
-from flask import Response, url_for
+from flask import Response, current_app, request, url_for
 
 from rhub.api import DEFAULT_PAGE_LIMIT, db, di
 from rhub.api.lab.region import _user_can_access_region
-from rhub.api.utils import date_now, date_parse, db_sort
+from rhub.api.utils import (
+    cursor_decode, cursor_encode, date_now, date_parse, request_cache,
+)
 from rhub.auth import model as auth_model
 from rhub.auth import utils as auth_utils
 from rhub.lab import SHAREDCLUSTER_GROUP, model
+from rhub.lab import tasks as lab_tasks
 from rhub.lab import utils as lab_utils
 from rhub.messaging import Messaging
 from rhub.openstack import model as openstack_model
@@ -19,11 +25,65 @@ from rhub.tower.client import TowerError
 
 logger = logging.getLogger(__name__)
 
-
+#: Sort columns of :func:`list_clusters`. Rows with NULL are last in ascending
+#: order and first in descending order, which is the PostgreSQL default, so
+#: the order can be read from plain ``(column, id)`` index.
+_CLUSTER_SORT_COLUMNS = {
+    'name': model.Cluster.name,
+    'reservation_expiration': model.Cluster.reservation_expiration,
+    'lifespan_expiration': model.Cluster.lifespan_expiration,
+}
+
+#: Sort columns of :func:`list_cluster_events`, ordered by
+#: ``(cluster_id, date, id)`` index.
+_CLUSTER_EVENT_SORT_COLUMNS = {
+    'date': model.ClusterEvent.date,
+}
+
+#: Eager loading of relationships used by :meth:`rhub.lab.model.Cluster.to_dict`
+#: and :func:`_cluster_href` in :func:`list_clusters`.
+_CLUSTER_LIST_LOADS = (
+    sqlalchemy.orm.selectinload(model.Cluster.region)
+    .joinedload(model.Region.user_quota),
+    sqlalchemy.orm.selectinload(model.Cluster.project)
+    .joinedload(openstack_model.Project.owner),
+    sqlalchemy.orm.selectinload(model.Cluster.project)
+    .joinedload(openstack_model.Project.group),
+    sqlalchemy.orm.selectinload(model.Cluster.product),
+    sqlalchemy.orm.selectinload(model.Cluster.hosts),
+)
+
+#: Maximal number of concurrent OpenStack requests in :func:`reboot_hosts`.
+_REBOOT_MAX_WORKERS = 16
+
+#: Maximal number of hostnames in one server list request in
+#: :func:`reboot_hosts`, the filter is sent in the URL query string.
+_REBOOT_HOSTNAME_BATCH = 50
+
+
+@request_cache
 def _user_is_cluster_admin(user_id):
     """Check if user is cluster admin."""
-    user = auth_model.User.query.get(user_id)
-    return user.is_admin or auth_model.Role.LAB_CLUSTER_ADMIN in user.roles
+    # Same as `user.is_admin or LAB_CLUSTER_ADMIN in user.roles` but in one
+    # query without loading the user.
+    query = (
+        db.session.query(auth_model.UserGroup.group_id)
+        .join(auth_model.Group, auth_model.Group.id == auth_model.UserGroup.group_id)
+        .filter(
+            auth_model.UserGroup.user_id == user_id,
+            sqlalchemy.or_(
+                auth_model.Group.roles.any(auth_model.Role.ADMIN),
+                auth_model.Group.roles.any(auth_model.Role.LAB_CLUSTER_ADMIN),
+            ),
+        )
+    )
+    return db.session.query(query.exists()).scalar()
+
+
+@request_cache
+def _user_group_ids(user_id):
+    """Cached :func:`rhub.auth.utils.user_group_ids`."""
+    return frozenset(auth_utils.user_group_ids(user_id))
 
 
 def _user_can_access_cluster(cluster, user_id):
@@ -33,7 +93,7 @@ def _user_can_access_cluster(cluster, user_id):
     if cluster.owner_id == user_id:
         return True
     if cluster.group_id is not None:
-        return cluster.group_id in auth_utils.user_group_ids(user_id)
+        return cluster.group_id in _user_group_ids(user_id)
     return False
 
 
@@ -43,7 +103,7 @@ def _user_can_create_reservation(region, user_id):
         return True
     if region.reservations_enabled:
         return True
-    return region.owner_group_id in auth_utils.user_group_ids(user_id)
+    return region.owner_group_id in _user_group_ids(user_id)
 
 
 def _user_can_set_lifespan(region, user_id):
@@ -52,7 +112,7 @@ def _user_can_set_lifespan(region, user_id):
         return True
     if auth_utils.is_user_in_group(user_id, SHAREDCLUSTER_GROUP):
         return True
-    return region.owner_group_id in auth_utils.user_group_ids(user_id)
+    return region.owner_group_id in _user_group_ids(user_id)
 
 
 def _user_can_disable_expiration(region, user_id):
@@ -61,7 +121,7 @@ def _user_can_disable_expiration(region, user_id):
         return True
     if auth_utils.is_user_in_group(user_id, SHAREDCLUSTER_GROUP):
         return True
-    return region.owner_group_id in auth_utils.user_group_ids(user_id)
+    return region.owner_group_id in _user_group_ids(user_id)
 
 
 def _user_can_create_sharedcluster(user_id):
@@ -70,119 +130,286 @@ def _user_can_create_sharedcluster(user_id):
     return auth_utils.is_user_in_group(user_id, SHAREDCLUSTER_GROUP)
 
 
-@functools.lru_cache()
+@request_cache
 def _get_sharedcluster_group_id():
-    q = auth_model.Group.query.filter(auth_model.Group.name == SHAREDCLUSTER_GROUP)
-    if q.count():
-        return q.first().id
+    q = (
+        db.session.query(auth_model.Group.id)
+        .filter(auth_model.Group.name == SHAREDCLUSTER_GROUP)
+    )
+    if group_id := q.scalar():
+        return group_id
     logger.error(f'{SHAREDCLUSTER_GROUP=} does not exist')
     return None
 
 
+def _strict_loads():
+    """
+    Query options to forbid lazy loads not covered by eager loading, enabled by
+    ``RHUB_STRICT_LOADS``.
+    """
+    if current_app.config.get('RHUB_STRICT_LOADS'):
+        return [sqlalchemy.orm.raiseload('*')]
+    return []
+
+
+def _url_template(endpoint, param):
+    """
+    Get URL of the endpoint with ``{}`` placeholder for the param. Hrefs are
+    built for each row in list endpoints, formatting a string is much cheaper
+    than routing lookup in :func:`flask.url_for`.
+
+    Templates are cached in the app, the URL depends also on the request
+    (script root and blueprint of relative endpoints).
+    """
+    cache = current_app.extensions.setdefault('rhub_lab_cluster_url_templates', {})
+    key = (request.script_root, request.blueprint, endpoint, param)
+    if key not in cache:
+        placeholder = 2 ** 31 - 1
+        url = url_for(endpoint, **{param: placeholder})
+        cache[key] = url.replace(str(placeholder), '{}')
+    return cache[key]
+
+
+def _url(endpoint, param, value):
+    return _url_template(endpoint, param).format(value)
+
+
 def _cluster_href(cluster):
     href = {
-        'cluster': url_for('.rhub_api_lab_cluster_get_cluster',
-                           cluster_id=cluster.id),
-        'cluster_events': url_for('.rhub_api_lab_cluster_list_cluster_events',
-                                  cluster_id=cluster.id),
-        'cluster_hosts': url_for('.rhub_api_lab_cluster_list_cluster_hosts',
-                                 cluster_id=cluster.id),
-        'cluster_reboot_hosts': url_for('.rhub_api_lab_cluster_reboot_hosts',
-                                        cluster_id=cluster.id),
-        'region': url_for('.rhub_api_lab_region_get_region',
-                          region_id=cluster.region_id),
-        'product': url_for('.rhub_api_lab_product_get_product',
-                           product_id=cluster.product_id),
-        'owner': url_for('.rhub_api_auth_user_user_get',
-                         user_id=cluster.owner_id),
-        'openstack': url_for('.rhub_api_openstack_cloud_get',
-                             cloud_id=cluster.region.openstack_id),
-        'project': url_for('.rhub_api_openstack_project_get',
-                           project_id=cluster.project_id),
+        'cluster': _url('.rhub_api_lab_cluster_get_cluster',
+                        'cluster_id', cluster.id),
+        'cluster_events': _url('.rhub_api_lab_cluster_list_cluster_events',
+                               'cluster_id', cluster.id),
+        'cluster_hosts': _url('.rhub_api_lab_cluster_list_cluster_hosts',
+                              'cluster_id', cluster.id),
+        'cluster_reboot_hosts': _url('.rhub_api_lab_cluster_reboot_hosts',
+                                     'cluster_id', cluster.id),
+        'region': _url('.rhub_api_lab_region_get_region',
+                       'region_id', cluster.region_id),
+        'product': _url('.rhub_api_lab_product_get_product',
+                        'product_id', cluster.product_id),
+        'owner': _url('.rhub_api_auth_user_user_get',
+                      'user_id', cluster.owner_id),
+        'openstack': _url('.rhub_api_openstack_cloud_get',
+                          'cloud_id', cluster.region.openstack_id),
+        'project': _url('.rhub_api_openstack_project_get',
+                        'project_id', cluster.project_id),
     }
     if cluster.group_id:
-        href['group'] = url_for('.rhub_api_auth_group_group_get',
-                                group_id=cluster.group_id)
+        href['group'] = _url('.rhub_api_auth_group_group_get',
+                             'group_id', cluster.group_id)
     return href
 
 
 def _cluster_event_href(cluster_event):
     href = {
-        'cluster': url_for('.rhub_api_lab_cluster_get_cluster',
-                           cluster_id=cluster_event.cluster_id),
-        'event': url_for('.rhub_api_lab_cluster_get_cluster_event',
-                         event_id=cluster_event.id)
+        'cluster': _url('.rhub_api_lab_cluster_get_cluster',
+                        'cluster_id', cluster_event.cluster_id),
+        'event': _url('.rhub_api_lab_cluster_get_cluster_event',
+                      'event_id', cluster_event.id),
     }
     if cluster_event.user_id:
-        href['user'] = url_for('.rhub_api_auth_user_user_get',
-                               user_id=cluster_event.user_id)
-    if (cluster_event.type == model.ClusterEventType.TOWER_JOB
-            and cluster_event.tower_id and cluster_event.tower_job_id):
-        href['tower'] = url_for('.rhub_api_tower_get_server',
-                                server_id=cluster_event.tower_id)
-        href['event_stdout'] = url_for('.rhub_api_lab_cluster_get_cluster_event_stdout',
-                                       event_id=cluster_event.id)
+        href['user'] = _url('.rhub_api_auth_user_user_get',
+                            'user_id', cluster_event.user_id)
+    # Only Tower job events have Tower links, other events (most of them in
+    # long-running clusters) are done here.
+    if cluster_event.type != model.ClusterEventType.TOWER_JOB:
+        return href
+    if cluster_event.tower_id and cluster_event.tower_job_id:
+        href['tower'] = _url('.rhub_api_tower_get_server',
+                             'server_id', cluster_event.tower_id)
+        href['event_stdout'] = _url('.rhub_api_lab_cluster_get_cluster_event_stdout',
+                                    'event_id', cluster_event.id)
     return href
 
 
 def _cluster_host_href(cluster_host):
     href = {
-        'cluster': url_for('.rhub_api_lab_cluster_get_cluster',
-                           cluster_id=cluster_host.cluster_id),
+        'cluster': _url('.rhub_api_lab_cluster_get_cluster',
+                        'cluster_id', cluster_host.cluster_id),
     }
     return href
 
 
-def list_clusters(user, filter_, sort=None, page=0, limit=DEFAULT_PAGE_LIMIT):
-    if _user_is_cluster_admin(user):
-        clusters = model.Cluster.query
+def _keyset(sort_columns, sort, id_column):
+    """Get columns that define order of rows for the sort parameter."""
+    if sort:
+        return (sort_columns[sort.removeprefix('-')], id_column)
+    return (id_column,)
+
+
+def _cursor(item, sort):
+    """Get cursor pointing after the item in listing ordered by the sort."""
+    data = {'sort': sort, 'id': item.id}
+    if sort:
+        value = getattr(item, sort.removeprefix('-'))
+        if isinstance(value, datetime.datetime):
+            value = value.isoformat()
+        data['value'] = value
+    return cursor_encode(data)
+
+
+def _cursor_values(cursor, sort, keyset):
+    """Decode the cursor created by :func:`_cursor` to keyset values."""
+    data = cursor_decode(cursor)
+    error = ValueError(f'{cursor!r} is not valid cursor for sort {sort!r}')
+    # Cursor is user input, values must be checked before they get into the
+    # query. bool is subclass of int.
+    if data.get('sort') != sort:
+        raise error
+    if not isinstance(data.get('id'), int) or isinstance(data['id'], bool):
+        raise error
+    if not sort:
+        return (data['id'],)
+    value = data.get('value')
+    if value is None:
+        if not keyset[0].expression.nullable:
+            raise error
+    elif not isinstance(value, str):
+        raise error
+    elif isinstance(keyset[0].type, sqlalchemy.DateTime):
+        value = date_parse(value)
+    return (value, data['id'])
+
+
+def _keyset_after(keyset, values, descending):
+    """
+    Get condition for rows after the keyset values, in ascending order rows
+    with NULL in the sort column are last, in descending order first.
+    """
+    compare = operator.lt if descending else operator.gt
+    if len(keyset) == 1:
+        return compare(keyset[0], values[0])
+
+    column, id_column = keyset
+    value, id_value = values
+    if value is None:
+        after = sqlalchemy.and_(column.is_(None), compare(id_column, id_value))
+        if descending:
+            return sqlalchemy.or_(after, column.isnot(None))
+        return after
+
+    # Row value comparison can be read from the (column, id) index.
+    after = compare(sqlalchemy.tuple_(column, id_column),
+                    sqlalchemy.tuple_(value, id_value))
+    if column.expression.nullable and not descending:
+        return sqlalchemy.or_(after, column.is_(None))
+    return after
+
+
+def _paginate(query, keyset, sort, page, limit, cursor, include_total):
+    """
+    Paginate the query by page number or by cursor (keyset pagination).
+
+    Returns dict with ``data`` (list of rows on the page), ``next_cursor``
+    and ``total`` if ``include_total`` is true, by default only in page based
+    listing.
+    """
+    if include_total is None:
+        include_total = cursor is None
+
+    count_query = query
+    # In page based listing the total is counted in the same query by window
+    # function, ``COUNT(*) OVER ()`` is evaluated before LIMIT and OFFSET. The
+    # cursor filter would change the count, so cursor listing uses separate
+    # COUNT query.
+    window_total = include_total and not cursor
+    if window_total:
+        query = query.add_columns(sqlalchemy.func.count().over().label('total'))
+    elif include_total:
+        total = count_query.count()
+
+    descending = bool(sort and sort.startswith('-'))
+
+    if descending:
+        query = query.order_by(*[i.desc().nulls_first() for i in keyset])
     else:
-        user_groups = auth_utils.user_group_ids(user)
+        query = query.order_by(*[i.asc().nulls_last() for i in keyset])
+
+    if cursor:
+        cursor_values = _cursor_values(cursor, sort, keyset)
+        query = query.filter(_keyset_after(keyset, cursor_values, descending))
+        query = query.limit(limit + 1)
+    else:
+        query = query.limit(limit + 1).offset(page * limit)
+
+    # One extra row is fetched to find out if there is a next page.
+    rows = query.all()
+
+    if window_total:
+        if rows:
+            total = rows[0][1]
+        elif page:
+            # Page after the last one, no row to carry the total.
+            total = count_query.count()
+        else:
+            total = 0
+        rows = [row[0] for row in rows]
+
+    data = {
+        'data': rows[:limit],
+        'next_cursor': (
+            _cursor(rows[limit - 1], sort) if len(rows) > limit else None
+        ),
+    }
+    if include_total:
+        data['total'] = total
+    return data
+
+
+def list_clusters(user, filter_, sort=None, page=0, limit=DEFAULT_PAGE_LIMIT,
+                  cursor=None, include_total=None):
+    # Filters are collected and applied at once, each Query.filter() call
+    # copies the whole query.
+    criteria = []
+
+    if not _user_is_cluster_admin(user):
+        user_groups = set(_user_group_ids(user))
         if sharedcluster_group_id := _get_sharedcluster_group_id():
             user_groups.add(sharedcluster_group_id)
-        clusters = model.Cluster.query.filter(sqlalchemy.or_(
+        criteria.append(sqlalchemy.or_(
             model.Cluster.owner_id == user,
             model.Cluster.group_id.in_(user_groups),
         ))
 
-    clusters = clusters.outerjoin(
+    clusters = model.Cluster.query.outerjoin(
         openstack_model.Project,
         openstack_model.Project.id == model.Cluster.project_id,
     )
 
     if 'name' in filter_:
-        clusters = clusters.filter(model.Cluster.name.ilike(filter_['name']))
+        criteria.append(model.Cluster.name.ilike(filter_['name']))
 
     if 'region_id' in filter_:
-        clusters = clusters.filter(model.Cluster.region_id == filter_['region_id'])
+        criteria.append(model.Cluster.region_id == filter_['region_id'])
 
     if 'owner_id' in filter_:
-        clusters = clusters.filter(model.Cluster.owner_id == filter_['owner_id'])
+        criteria.append(model.Cluster.owner_id == filter_['owner_id'])
 
     if 'owner_name' in filter_:
         owner = sqlalchemy.orm.aliased(auth_model.User)
         clusters = clusters.outerjoin(
             owner, owner.id == openstack_model.Project.owner_id
         )
-        clusters = clusters.filter(owner.name == filter_['owner_name'])
+        criteria.append(owner.name == filter_['owner_name'])
 
     if 'group_id' in filter_:
-        clusters = clusters.filter(model.Cluster.group_id == filter_['group_id'])
+        criteria.append(model.Cluster.group_id == filter_['group_id'])
 
     if 'group_name' in filter_:
         group = sqlalchemy.orm.aliased(auth_model.Group)
         clusters = clusters.outerjoin(
             group, group.id == openstack_model.Project.group_id
         )
-        clusters = clusters.filter(group.name == filter_['group_name'])
+        criteria.append(group.name == filter_['group_name'])
 
     if 'status' in filter_:
-        clusters = clusters.filter(
+        criteria.append(
             model.Cluster.status == model.ClusterStatus(filter_['status'])
         )
 
     if 'status_flag' in filter_:
-        clusters = clusters.filter(
+        criteria.append(
             model.Cluster.status.in_(
                 model.ClusterStatus.flag_statuses(filter_['status_flag'])
             )
@@ -191,35 +418,33 @@ def list_clusters(user, filter_, sort=None, page=0, limit=DEFAULT_PAGE_LIMIT):
     if 'shared' in filter_:
         if sharedcluster_group_id := _get_sharedcluster_group_id():
             if filter_['shared']:
-                clusters = clusters.filter(
-                    model.Cluster.group_id == sharedcluster_group_id
-                )
+                criteria.append(model.Cluster.group_id == sharedcluster_group_id)
             else:
-                clusters = clusters.filter(
-                    model.Cluster.group_id != sharedcluster_group_id
-                )
+                criteria.append(model.Cluster.group_id != sharedcluster_group_id)
 
     if filter_.get('deleted', False):
-        clusters = clusters.filter(
-            model.Cluster.status == model.ClusterStatus.DELETED
-        )
+        criteria.append(model.Cluster.status == model.ClusterStatus.DELETED)
     else:
-        clusters = clusters.filter(
-            model.Cluster.status != model.ClusterStatus.DELETED
-        )
+        criteria.append(model.Cluster.status != model.ClusterStatus.DELETED)
 
-    if sort:
-        clusters = db_sort(clusters, sort, {
-            'name': 'lab_cluster.name',
-        })
-
-    return {
-        'data': [
-            cluster.to_dict() | {'_href': _cluster_href(cluster)}
-            for cluster in clusters.limit(limit).offset(page * limit)
+    clusters = clusters.filter(*criteria)
+
+    clusters = clusters.options(
+        *_CLUSTER_LIST_LOADS,
+        *[
+            sqlalchemy.orm.defer(getattr(model.Cluster, column))
+            for column in model.Cluster.LIST_DEFERRED_COLUMNS
         ],
-        'total': clusters.count(),
-    }
+        *_strict_loads(),
+    )
+
+    keyset = _keyset(_CLUSTER_SORT_COLUMNS, sort, model.Cluster.id)
+    page_data = _paginate(clusters, keyset, sort, page, limit, cursor, include_total)
+    page_data['data'] = [
+        cluster.to_dict(list_view=True) | {'_href': _cluster_href(cluster)}
+        for cluster in page_data['data']
+    ]
+    return page_data
 
 
 def create_cluster(body, user):
@@ -245,7 +470,7 @@ def create_cluster(body, user):
             model.Cluster.status != model.ClusterStatus.DELETED,
         )
     )
-    if query.count() > 0:
+    if db.session.query(query.exists()).scalar():
         return problem(
             400, 'Bad Request',
             f'Cluster with name {body["name"]!r} already exists',
@@ -349,9 +574,8 @@ def create_cluster(body, user):
                 openstack_model.Project.name == project_name,
             )
         )
-        if project_query.count() > 0:
-            project = project_query.first()
-        else:
+        project = project_query.first()
+        if project is None:
             project = openstack_model.Project(
                 cloud_id=region.openstack.id,
                 name=project_name,
@@ -393,11 +617,11 @@ def create_cluster(body, user):
             user_quota = region.user_quota.to_dict()
             user_quota_usage = region.get_user_quota_usage(user)
 
-            exceeded_resources = []
-            for k in user_quota:
-                if (user_quota[k] is not None  # Quota fields are nullable
-                        and (user_quota_usage[k] + cluster_usage[k]) > user_quota[k]):
-                    exceeded_resources.append(k)
+            exceeded_resources = [
+                k for k, limit in user_quota.items()
+                if limit is not None  # Quota fields are nullable
+                and user_quota_usage[k] + cluster_usage[k] > limit
+            ]
 
             if exceeded_resources:
                 logger.error(
@@ -416,43 +640,22 @@ def create_cluster(body, user):
             return problem(500, 'Internal Server Error',
                            'Failed to calculate cluster usage.')
 
-    try:
-        tower_client = region.tower.create_tower_client()
-        tower_template = tower_client.template_get(
-            template_name=product.tower_template_name_create,
-        )
-
-        logger.info(
-            f'Launching Tower template {tower_template["name"]} '
-            f'(id={tower_template["id"]}), '
-            f'extra_vars={cluster.tower_launch_extra_vars!r}',
-            extra={'user_id': user},
-        )
-        tower_job = tower_client.template_launch(
-            tower_template['id'],
-            {'extra_vars': cluster.tower_launch_extra_vars},
-        )
+    # Tower template is launched by the worker after the cluster is committed,
+    # the transaction is not held open while waiting for Tower.
+    cluster.status = model.ClusterStatus.QUEUED
+    db.session.commit()
 
-        cluster_event = model.ClusterTowerJobEvent(
-            cluster_id=cluster.id,
-            user_id=user,
-            date=date_now(),
-            tower_id=region.tower_id,
-            tower_job_id=tower_job['id'],
-            status=model.ClusterStatus.QUEUED,
+    try:
+        lab_tasks.launch_cluster_create.apply_async(
+            (cluster.id, user),
+            priority=lab_tasks.LAUNCH_CLUSTER_CREATE_PRIORITY,
         )
-        db.session.add(cluster_event)
-
-        cluster.status = model.ClusterStatus.QUEUED
-
     except Exception as e:
-        db.session.rollback()
-        logger.exception(f'Failed to trigger cluster creation in Tower, {e!s}')
+        logger.exception(f'Failed to dispatch cluster creation task, {e!s}')
+        lab_utils.mark_cluster_create_failed(cluster)
         return problem(500, 'Internal Server Error',
                        'Failed to trigger cluster creation.')
 
-    db.session.commit()
-
     logger.info(
         f'Cluster {cluster.name} (id {cluster.id}) created by user {user}',
         extra={'user_id': user, 'cluster_id': cluster.id},
@@ -488,6 +691,7 @@ def update_cluster_extra(cluster_id, body, user):
         return problem(400, 'Bad Request',
                        f"Can't update, cluster {cluster_id} is in deleted state")
 
+    now = date_now()
     cluster_data = body['cluster_data'].copy()
     tower_job_id = body.get('tower_job_id')
 
@@ -515,7 +719,7 @@ def update_cluster_extra(cluster_id, body, user):
         cluster_event = model.ClusterLifespanChangeEvent(
             cluster_id=cluster.id,
             user_id=user,
-            date=date_now(),
+            date=now,
             old_value=cluster.lifespan_expiration,
             new_value=cluster_data['lifespan_expiration']
         )
@@ -540,7 +744,7 @@ def update_cluster_extra(cluster_id, body, user):
             cluster_data['reservation_expiration'] = reservation_expiration
             if cluster.region.reservation_expiration_max:
                 reservation_expiration_max = (
-                    (cluster.reservation_expiration or date_now())
+                    (cluster.reservation_expiration or now)
                     + cluster.region.reservation_expiration_max_delta
                 )
                 if cluster.lifespan_expiration:
@@ -555,7 +759,7 @@ def update_cluster_extra(cluster_id, body, user):
         cluster_event = model.ClusterReservationChangeEvent(
             cluster_id=cluster.id,
             user_id=user,
-            date=date_now(),
+            date=now,
             old_value=cluster.reservation_expiration,
             new_value=cluster_data['reservation_expiration']
         )
@@ -579,7 +783,7 @@ def update_cluster_extra(cluster_id, body, user):
         cluster_event = model.ClusterTowerJobEvent(
             cluster_id=cluster.id,
             user_id=user,
-            date=date_now(),
+            date=now,
             status=cluster_data['status'],
             tower_id=cluster.region.tower_id if tower_job_id else None,
             tower_job_id=tower_job_id,
@@ -646,7 +850,8 @@ def delete_cluster(cluster_id, user):
                        'Failed to trigger cluster deletion.')
 
 
-def list_cluster_events(cluster_id, user):
+def list_cluster_events(cluster_id, user, sort='-date', page=0,
+                        limit=DEFAULT_PAGE_LIMIT, cursor=None, include_total=None):
     cluster = model.Cluster.query.get(cluster_id)
     if not cluster:
         return problem(404, 'Not Found', f'Cluster {cluster_id} does not exist')
@@ -654,10 +859,22 @@ def list_cluster_events(cluster_id, user):
     if not _user_can_access_cluster(cluster, user) and not cluster.shared:
         return problem(403, 'Forbidden', "You don't have access to this cluster.")
 
-    return [
+    events = (
+        model.ClusterEvent.query
+        .filter(model.ClusterEvent.cluster_id == cluster.id)
+        .options(
+            sqlalchemy.orm.joinedload(model.ClusterEvent.user),
+            *_strict_loads(),
+        )
+    )
+
+    keyset = _keyset(_CLUSTER_EVENT_SORT_COLUMNS, sort, model.ClusterEvent.id)
+    page_data = _paginate(events, keyset, sort, page, limit, cursor, include_total)
+    page_data['data'] = [
         event.to_dict() | {'_href': _cluster_event_href(event)}
-        for event in cluster.events
+        for event in page_data['data']
     ]
+    return page_data
 
 
 def get_cluster_event(event_id, user):
@@ -686,7 +903,8 @@ def get_cluster_event_stdout(event_id, user):
         return problem(404, 'Error', 'Failed to get output from Tower')
 
 
-def list_cluster_hosts(cluster_id, user):
+def list_cluster_hosts(cluster_id, user, page=0, limit=DEFAULT_PAGE_LIMIT,
+                       cursor=None, include_total=None):
     cluster = model.Cluster.query.get(cluster_id)
     if not cluster:
         return problem(404, 'Not Found', f'Cluster {cluster_id} does not exist')
@@ -694,10 +912,19 @@ def list_cluster_hosts(cluster_id, user):
     if not _user_can_access_cluster(cluster, user) and not cluster.shared:
         return problem(403, 'Forbidden', "You don't have access to this cluster.")
 
-    return [
+    hosts = (
+        model.ClusterHost.query
+        .filter(model.ClusterHost.cluster_id == cluster.id)
+        .options(*_strict_loads())
+    )
+
+    keyset = (model.ClusterHost.id,)
+    page_data = _paginate(hosts, keyset, None, page, limit, cursor, include_total)
+    page_data['data'] = [
         host.to_dict() | {'_href': _cluster_host_href(host)}
-        for host in cluster.hosts
+        for host in page_data['data']
     ]
+    return page_data
 
 
 @auth_utils.route_require_admin
@@ -706,18 +933,18 @@ def create_cluster_hosts(cluster_id, body, user):
     if not cluster:
         return problem(404, 'Not Found', f'Cluster {cluster_id} does not exist')
 
-    hosts = []
-    for host_data in body:
-        host = model.ClusterHost.from_dict({'cluster_id': cluster_id, **host_data})
-        hosts.append(host)
-
-        db.session.add(host)
-        db.session.flush()
+    hosts = [
+        model.ClusterHost.from_dict({'cluster_id': cluster_id, **host_data})
+        for host_data in body
+    ]
+    db.session.add_all(hosts)
+    db.session.flush()
 
-        logger.info(
-            f'Adding host ID={host.id} FQDN={host.fqdn} to cluster ID={cluster.id}',
-            extra={'user_id': user, 'cluster_id': cluster.id},
-        )
+    logger.info(
+        f'Adding {len(hosts)} hosts IDs={[host.id for host in hosts]} '
+        f'to cluster ID={cluster.id}',
+        extra={'user_id': user, 'cluster_id': cluster.id},
+    )
 
     db.session.commit()
 
@@ -733,13 +960,16 @@ def delete_cluster_hosts(cluster_id, user):
     if not cluster:
         return problem(404, 'Not Found', f'Cluster {cluster_id} does not exist')
 
-    for host in cluster.hosts:
-        logger.info(
-            f'Deleting host ID={host.id} FQDN={host.fqdn} from cluster ID={cluster.id}',
-            extra={'user_id': user, 'cluster_id': cluster.id},
-        )
-        db.session.delete(host)
-        db.session.flush()
+    deleted_count = (
+        model.ClusterHost.query
+        .filter(model.ClusterHost.cluster_id == cluster.id)
+        .delete(synchronize_session=False)
+    )
+
+    logger.info(
+        f'Deleted {deleted_count} hosts from cluster ID={cluster.id}',
+        extra={'user_id': user, 'cluster_id': cluster.id},
+    )
 
     db.session.commit()
 
@@ -757,36 +987,69 @@ def reboot_hosts(cluster_id, body, user):
     if body['hosts'] == 'all':
         hosts_to_reboot = {host.fqdn: host for host in cluster.hosts}
     else:
-        hosts_to_reboot = {
-            host.fqdn: host
-            for host in model.ClusterHost.query.filter(
-                sqlalchemy.and_(
-                    model.ClusterHost.cluster_id == cluster.id,
-                    sqlalchemy.or_(
-                        model.ClusterHost.id.in_(
-                            [i['id'] for i in body['hosts'] if 'id' in i]
-                        ),
-                        model.ClusterHost.fqdn.in_(
-                            [i['fqdn'] for i in body['hosts'] if 'fqdn' in i]
-                        ),
-                    ),
-                )
-            ).all()
-        }
+        host_ids, host_fqdns = [], []
+        for i in body['hosts']:
+            if 'id' in i:
+                host_ids.append(i['id'])
+            if 'fqdn' in i:
+                host_fqdns.append(i['fqdn'])
+
+        # Empty lists are left out of the OR condition.
+        criteria = []
+        if host_ids:
+            criteria.append(model.ClusterHost.id.in_(host_ids))
+        if host_fqdns:
+            criteria.append(model.ClusterHost.fqdn.in_(host_fqdns))
+
+        if criteria:
+            hosts_query = model.ClusterHost.query.filter(
+                model.ClusterHost.cluster_id == cluster.id,
+                sqlalchemy.or_(*criteria),
+            )
+            hosts_to_reboot = {host.fqdn: host for host in hosts_query.all()}
+        else:
+            hosts_to_reboot = {}
 
-    rebooted_hosts = []
+    if not hosts_to_reboot:
+        return []
 
     try:
         os_client = cluster.project.create_openstack_client()
-        for server in os_client.compute.servers():
-            if server.hostname in hosts_to_reboot:
-                logger.info(
-                    f'Rebooting cluster host {server.hostname}, '
-                    f'cluster_id={cluster.id}',
-                    extra={'user_id': user, 'cluster_id': cluster.id},
-                )
-                os_client.compute.reboot_server(server, reboot_type)
-                rebooted_hosts.append(hosts_to_reboot[server.hostname])
+
+        # Nova matches the hostname filter as a regular expression. It is sent
+        # in the URL, so hostnames are split into batches to keep the URL
+        # short in large clusters. The filter may be ignored (e.g. for
+        # non-admin users), so the hostname is checked again below and
+        # servers are deduplicated by ID.
+        hostnames = list(hosts_to_reboot)
+        servers = {}
+        for i in range(0, len(hostnames), _REBOOT_HOSTNAME_BATCH):
+            hostname_regex = '^({})$'.format(
+                '|'.join(map(re.escape, hostnames[i:i + _REBOOT_HOSTNAME_BATCH]))
+            )
+            for server in os_client.compute.servers(hostname=hostname_regex):
+                if server.hostname in hosts_to_reboot:
+                    servers[server.id] = server
+        servers = list(servers.values())
+
+        for server in servers:
+            logger.info(
+                f'Rebooting cluster host {server.hostname}, '
+                f'cluster_id={cluster.id}',
+                extra={'user_id': user, 'cluster_id': cluster.id},
+            )
+
+        # Reboot requests are independent, send them concurrently instead of
+        # waiting for each response.
+        if servers:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(_REBOOT_MAX_WORKERS, len(servers)),
+            ) as executor:
+                list(executor.map(
+                    lambda server: os_client.compute.reboot_server(server, reboot_type),
+                    servers,
+                ))
+        rebooted_hosts = [hosts_to_reboot[server.hostname] for server in servers]
     except Exception as e:
         logger.exception(f'Failed to reboot nodes, {e!s}')
         return problem(500, 'Server Error', 'Failed to reboot nodes')
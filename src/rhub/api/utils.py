@@ -1,9 +1,13 @@
+import base64
 import copy
 import datetime
+import functools
+import json
 import socket
 import urllib.parse
 
 import dateutil.parser
+import flask
 from sqlalchemy import event
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import declarative_mixin, declared_attr
@@ -18,11 +22,17 @@ class ModelMixin:
     __embedded__ = []       # read-write embedding
     __embedded_ro__ = []    # read-only embedding
 
-    def to_dict(self):
-        """Covert a model's object to `dict`, with parent's columns."""
+    def to_dict(self, exclude=()):
+        """
+        Covert a model's object to `dict`, with parent's columns.
+
+        :param exclude: names of columns to skip, e.g. deferred columns
+        """
         data = {}
 
         for column in inspect(self.__class__).columns:
+            if column.name in exclude:
+                continue
             data[column.name] = getattr(self, column.name)
 
         for embedded_name in self.__embedded__ + self.__embedded_ro__:
@@ -119,6 +129,46 @@ def db_sort(query, sort_by, column_remap=None):
     return query.order_by(db.text(f'{column} {direction}'))
 
 
+def request_cache(fn):
+    """
+    Decorator to cache function results in :data:`flask.g` for the duration of
+    a request. Unlike :func:`functools.lru_cache`, cached values are dropped
+    when the request ends, so there is no need for invalidation.
+
+    Outside of request context (e.g. in Celery worker, which keeps one app
+    context for its whole lifetime) the function is called without caching.
+    """
+    cache_name = f'_request_cache_{fn.__module__}.{fn.__qualname__}'
+
+    @functools.wraps(fn)
+    def inner(*args):
+        if not flask.has_request_context():
+            return fn(*args)
+        cache = flask.g.setdefault(cache_name, {})
+        if args not in cache:
+            cache[args] = fn(*args)
+        return cache[args]
+
+    return inner
+
+
+def cursor_encode(data):
+    """Encode keyset pagination cursor to opaque URL-safe string."""
+    raw = json.dumps(data, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def cursor_decode(cursor):
+    """Decode keyset pagination cursor created by :func:`cursor_encode`."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception as e:
+        raise ValueError(f'{cursor!r} is not valid cursor') from e
+    if not isinstance(data, dict):
+        raise ValueError(f'{cursor!r} is not valid cursor')
+    return data
+
+
 def condition_eval(expr, params):
     """
     Evaluate condition expression.
@@ -1,5 +1,6 @@
 import datetime
 import enum
+import functools
 import re
 
 from sqlalchemy.dialects import postgresql
@@ -245,9 +246,10 @@ class ClusterStatus(str, enum.Enum):
         return self.flag == 'deleting'
 
     @classmethod
+    @functools.lru_cache()
     def flag_statuses(cls, flag):
-        """Get list of status for a given flag."""
-        return [i for i in cls if i.flag == flag]
+        """Get tuple of statuses for a given flag."""
+        return tuple(i for i in cls if i.flag == flag)
 
 
 class Cluster(db.Model, ModelMixin):
@@ -261,6 +263,11 @@ class Cluster(db.Model, ModelMixin):
                 db.Column('status') != ClusterStatus.DELETED.name
             ),
         ),
+        # Keyset pagination in cluster list, see rhub.api.lab.cluster.
+        db.Index('ix_lab_cluster_reservation_expiration',
+                 'reservation_expiration', 'id'),
+        db.Index('ix_lab_cluster_lifespan_expiration',
+                 'lifespan_expiration', 'id'),
     )
 
     id = db.Column(db.Integer, primary_key=True)
@@ -306,6 +313,10 @@ class Cluster(db.Model, ModelMixin):
         'tower',
     ]
 
+    #: Columns not needed in the cluster list, deferred when loading clusters
+    #: for the list and left out by ``to_dict(list_view=True)``.
+    LIST_DEFERRED_COLUMNS = ('product_params',)
+
     @validates('name')
     def validate_name(self, key, value):
         if value.lower() in self.RESERVED_NAMES:
@@ -402,8 +413,11 @@ class Cluster(db.Model, ModelMixin):
         }
         return rhub_extra_vars | self.product_params
 
-    def to_dict(self):
-        data = super().to_dict()
+    def to_dict(self, list_view=False):
+        if list_view:
+            data = super().to_dict(exclude=self.LIST_DEFERRED_COLUMNS)
+        else:
+            data = super().to_dict()
 
         data['region_name'] = self.region.name
         data['owner_id'] = self.owner_id
@@ -447,8 +461,15 @@ class ClusterEventType(str, enum.Enum):
 
 class ClusterEvent(db.Model, ModelMixin):
     __tablename__ = 'lab_cluster_event'
+    __table_args__ = (
+        # Keyset pagination in cluster events list, see rhub.api.lab.cluster.
+        db.Index('ix_lab_cluster_event_cluster_id_date', 'cluster_id', 'date', 'id'),
+    )
     __mapper_args__ = {
         'polymorphic_on': 'type',
+        # Load columns of all subclasses in queries of the base class, else
+        # each subclass column read by to_dict() is loaded by its own query.
+        'with_polymorphic': '*',
     }
 
     id = db.Column(db.Integer, primary_key=True)
@@ -462,6 +483,12 @@ class ClusterEvent(db.Model, ModelMixin):
     cluster = db.relationship('Cluster', back_populates='events')
 
     def to_dict(self):
+        """
+        Serialize the event from its columns and the user. Must not make any
+        external requests, it is used for every event in the events list. Tower
+        job output is only fetched by
+        :meth:`ClusterTowerJobEvent.get_tower_job_output`.
+        """
         data = {}
         for column in self.__table__.columns:
             if hasattr(self, column.name):
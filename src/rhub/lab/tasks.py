@@ -0,0 +1,44 @@
+import logging
+
+from rhub.lab import model
+from rhub.lab import utils as lab_utils
+from rhub.worker import celery
+
+
+logger = logging.getLogger(__name__)
+
+#: Priority of :func:`launch_cluster_create` tasks, the maximal priority of
+#: the default queue (see :mod:`rhub.worker.flask_celery`). Users wait for the
+#: cluster creation, it should not wait for long-running cron jobs in the queue.
+LAUNCH_CLUSTER_CREATE_PRIORITY = 10
+
+
+@celery.task(ignore_result=True)
+def launch_cluster_create(cluster_id, user_id=None):
+    """
+    Launch cluster create template in Tower. The cluster is committed in the
+    queued state by :func:`rhub.api.lab.cluster.create_cluster` before this
+    task is dispatched, so the request does not hold the transaction open while
+    waiting for Tower.
+
+    If the task is lost, the cluster is marked as failed by
+    :func:`rhub.scheduler.jobs.fail_stale_queued_clusters`.
+    """
+    cluster = model.Cluster.query.get(cluster_id)
+    if not cluster:
+        logger.error(f'Cluster ID={cluster_id} does not exist')
+        return
+
+    # The cluster may have been marked as failed by the cron job while the
+    # task was waiting in the queue.
+    if cluster.status != model.ClusterStatus.QUEUED:
+        logger.warning(
+            f'Not launching creation of cluster ID={cluster_id}, cluster is '
+            f'not queued, {cluster.status=}',
+        )
+        return
+
+    try:
+        lab_utils.create_cluster(cluster, user_id)
+    except Exception:
+        lab_utils.mark_cluster_create_failed(cluster)
@@ -1,13 +1,90 @@
 import logging
 
-from rhub.api import db
+from rhub.api import db, di
 from rhub.api.utils import date_now
 from rhub.lab import model
+from rhub.messaging import Messaging
 
 
 logger = logging.getLogger(__name__)
 
 
+def create_cluster(cluster, user=None):
+    try:
+        tower_client = cluster.region.tower.create_tower_client()
+        tower_template = tower_client.template_get(
+            template_name=cluster.product.tower_template_name_create,
+        )
+
+        logger.info(
+            f'Launching Tower template {tower_template["name"]} '
+            f'(id={tower_template["id"]}), '
+            f'extra_vars={cluster.tower_launch_extra_vars!r}',
+            extra={'user_id': user, 'cluster_id': cluster.id},
+        )
+        tower_job = tower_client.template_launch(
+            tower_template['id'],
+            {'extra_vars': cluster.tower_launch_extra_vars},
+        )
+
+        cluster_event = model.ClusterTowerJobEvent(
+            cluster_id=cluster.id,
+            user_id=user,
+            date=date_now(),
+            tower_id=cluster.region.tower_id,
+            tower_job_id=tower_job['id'],
+            status=model.ClusterStatus.QUEUED,
+        )
+        db.session.add(cluster_event)
+
+        cluster.status = model.ClusterStatus.QUEUED
+
+        db.session.commit()
+        logger.info(
+            f'Cluster {cluster.name} (id {cluster.id}) creation launched in Tower, '
+            f'job ID={tower_job["id"]}',
+            extra={'user_id': user, 'cluster_id': cluster.id},
+        )
+
+    except Exception as e:
+        db.session.rollback()
+        logger.exception(
+            f'Failed to trigger cluster ID={cluster.id} creation in Tower, {e!s}'
+        )
+        raise
+
+
+def mark_cluster_create_failed(cluster):
+    """
+    Set the cluster status to :attr:`ClusterStatus.CREATE_FAILED` when
+    creation could not be launched in Tower, and notify the owner. The cluster
+    keeps its name until the user deletes it, same as clusters whose Tower
+    create job failed.
+    """
+    cluster_event = model.ClusterStatusChangeEvent(
+        cluster_id=cluster.id,
+        user_id=None,
+        date=date_now(),
+        old_value=cluster.status,
+        new_value=model.ClusterStatus.CREATE_FAILED,
+    )
+    db.session.add(cluster_event)
+    cluster.status = model.ClusterStatus.CREATE_FAILED
+    db.session.commit()
+
+    di.get(Messaging).send(
+        'lab.cluster.create',
+        f'Failed to create cluster "{cluster.name}" (ID={cluster.id}).',
+        extra={
+            'owner_id': cluster.owner_id,
+            'owner_name': cluster.owner.name,
+            'cluster_id': cluster.id,
+            'cluster_name': cluster.name,
+            'tower_id': cluster.region.tower_id,
+        },
+    )
+
+
 def delete_cluster(cluster, user=None):
     try:
         tower_client = cluster.region.tower.create_tower_client()
@@ -197,6 +197,44 @@ def cleanup_deleted_clusters(params):
             )
 
 
+@CronJob
+def fail_stale_queued_clusters(params):
+    """
+    Mark clusters stuck in the queued status as failed. Cluster creation is
+    launched in Tower by :func:`rhub.lab.tasks.launch_cluster_create`, if the
+    task is lost the cluster stays queued and the user can't delete it.
+
+    params:
+        queued_timeout -- number of minutes after creation when queued cluster
+            without any Tower job is considered stale, optional, default is 60
+    """
+    now = date_now()
+    queued_timeout = datetime.timedelta(minutes=params.get('queued_timeout', 60))
+
+    stale_clusters = lab_model.Cluster.query.filter(
+        lab_model.Cluster.status == lab_model.ClusterStatus.QUEUED,
+        lab_model.Cluster.created <= now - queued_timeout,
+        ~lab_model.Cluster.events.any(
+            lab_model.ClusterEvent.type == lab_model.ClusterEventType.TOWER_JOB,
+        ),
+    )
+
+    for cluster in stale_clusters.all():
+        logger.warning(
+            f'Cluster "{cluster.name}" ({cluster.id=}) creation was not launched '
+            f'in Tower since {cluster.created}, marking it as failed',
+            extra={'cluster_id': cluster.id},
+        )
+        try:
+            lab_utils.mark_cluster_create_failed(cluster)
+        except Exception:
+            db.session.rollback()
+            logger.exception(
+                f'Failed to mark stale cluster "{cluster.name}" ({cluster.id=}) '
+                'as failed'
+            )
+
+
 @CronJob
 def update_ldap_data(params):
     auth_tasks.cleanup_users()
@@ -3,10 +3,14 @@ import datetime
 from unittest.mock import ANY
 
 import pytest
+import sqlalchemy
+import sqlalchemy.dialects.postgresql
 from dateutil.tz import tzutc
 
+from rhub.api import DEFAULT_PAGE_LIMIT
 from rhub.auth import model as auth_model
 from rhub.lab import SHAREDCLUSTER_GROUP, model
+from rhub.lab import tasks as lab_tasks
 from rhub.openstack import model as openstack_model
 from rhub.tower import model as tower_model
 from rhub.tower.client import TowerError
@@ -23,6 +27,13 @@ def date_now_mock(mocker):
     yield date_now_mock
 
 
+@pytest.fixture(autouse=True)
+def user_is_cluster_admin_mock(mocker):
+    m = mocker.patch('rhub.api.lab.cluster._user_is_cluster_admin')
+    m.return_value = True
+    yield m
+
+
 def _db_add_row_side_effect(data_added):
     def side_effect(row):
         for k, v in data_added.items():
@@ -30,6 +41,42 @@ def _db_add_row_side_effect(data_added):
     return side_effect
 
 
+def test_user_is_cluster_admin(client, mocker):
+    # Undo patches of `_user_is_cluster_admin` from autouse fixtures.
+    mocker.stopall()
+    db_session_mock = mocker.patch('rhub.api.db.session')
+
+    from rhub.api.lab.cluster import _user_is_cluster_admin
+
+    with client.application.test_request_context():
+        result = _user_is_cluster_admin(1)
+
+    assert db_session_mock.query.call_args_list[0].args[0] is auth_model.UserGroup.group_id
+
+    join = db_session_mock.query.return_value.join.call_args.args
+    assert join[0] is auth_model.Group
+
+    filtered_query = db_session_mock.query.return_value.join.return_value.filter
+    user_criterion, roles_criterion = filtered_query.call_args.args
+    user_sql = user_criterion.compile(dialect=sqlalchemy.dialects.postgresql.dialect())
+    assert str(user_sql) == 'auth_user_group.user_id = %(user_id_1)s'
+    assert user_sql.params == {'user_id_1': 1}
+
+    roles_sql = roles_criterion.compile(dialect=sqlalchemy.dialects.postgresql.dialect())
+    assert str(roles_sql) == (
+        '%(roles_1)s = ANY (auth_group.roles) OR %(roles_2)s = ANY (auth_group.roles)'
+    )
+    assert set(roles_sql.params.values()) == {
+        auth_model.Role.ADMIN, auth_model.Role.LAB_CLUSTER_ADMIN,
+    }
+
+    # Result is EXISTS of the filtered query.
+    assert db_session_mock.query.call_args_list[1].args[0] is (
+        filtered_query.return_value.exists.return_value
+    )
+    assert result is db_session_mock.query.return_value.scalar.return_value
+
+
 @pytest.fixture
 def auth_user(mocker):
     mocker.patch('rhub.api.lab.cluster._user_can_access_region').return_value = True
@@ -275,6 +322,13 @@ def product():
     yield product
 
 
+@pytest.fixture(autouse=True)
+def lab_tasks_mock(mocker):
+    m = mocker.patch('rhub.api.lab.cluster.lab_tasks')
+    m.LAUNCH_CLUSTER_CREATE_PRIORITY = lab_tasks.LAUNCH_CLUSTER_CREATE_PRIORITY
+    yield m
+
+
 @pytest.fixture
 def tower_client(mocker):
     m = mocker.Mock()
@@ -292,8 +346,8 @@ def _cluster_href(mocker):
 
 
 def test_list_clusters(client, mocker, region, project, product):
-    q = model.Cluster.query.outerjoin.return_value.filter.return_value
-    q.limit.return_value.offset.return_value = [
+    q = model.Cluster.query.outerjoin.return_value.filter.return_value.options.return_value
+    clusters = [
         model.Cluster(
             id=1,
             name='testcluster',
@@ -311,7 +365,9 @@ def test_list_clusters(client, mocker, region, project, product):
             product=product,
         ),
     ]
-    q.count.return_value = 1
+    q.add_columns.return_value.order_by.return_value.limit.return_value.offset.return_value.all.return_value = [
+        (cluster, 1) for cluster in clusters
+    ]
 
     mocker.patch.object(model.Cluster, 'hosts', [])
     mocker.patch.object(model.Cluster, 'quota', None)
@@ -346,15 +402,241 @@ def test_list_clusters(client, mocker, region, project, product):
                 'quota_usage': None,
                 'product_id': 1,
                 'product_name': 'dummy',
-                'product_params': {},
                 'shared': False,
                 '_href': ANY,
             },
         ],
+        'next_cursor': None,
         'total': 1,
     }
 
 
+def test_list_clusters_cursor(client, mocker, region, project, product):
+    clusters = [
+        model.Cluster(
+            id=i,
+            name=f'testcluster{i}',
+            description='test cluster',
+            created=datetime.datetime(2021, 1, 1, 1, 0, 0, tzinfo=tzutc()),
+            region_id=1,
+            region=region,
+            project_id=1,
+            project=project,
+            reservation_expiration=None,
+            lifespan_expiration=None,
+            status=model.ClusterStatus.ACTIVE,
+            product_id=1,
+            product_params={},
+            product=product,
+        )
+        for i in range(1, 4)
+    ]
+
+    q = model.Cluster.query.outerjoin.return_value.filter.return_value.options.return_value
+    q.order_by.return_value.filter.return_value.limit.return_value.all.return_value = clusters
+
+    mocker.patch.object(model.Cluster, 'hosts', [])
+    mocker.patch.object(model.Cluster, 'quota', None)
+
+    cursor = base64.urlsafe_b64encode(b'{"sort":"name","value":"testcluster0","id":10}')
+
+    rv = client.get(
+        f'{API_BASE}/lab/cluster',
+        headers=AUTH_HEADER,
+        query_string={'sort': 'name', 'limit': 2, 'cursor': cursor.decode()},
+    )
+
+    assert rv.status_code == 200, rv.data
+    assert [i['id'] for i in rv.json['data']] == [1, 2]
+    assert 'total' not in rv.json
+    assert base64.urlsafe_b64decode(rv.json['next_cursor']) == (
+        b'{"sort":"name","id":2,"value":"testcluster2"}'
+    )
+    q.order_by.return_value.filter.return_value.limit.assert_called_with(3)
+
+
+def test_list_clusters_total_after_last_page(client):
+    q = model.Cluster.query.outerjoin.return_value.filter.return_value.options.return_value
+    q.add_columns.return_value.order_by.return_value.limit.return_value.offset.return_value.all.return_value = []
+    q.count.return_value = 3
+
+    rv = client.get(
+        f'{API_BASE}/lab/cluster',
+        headers=AUTH_HEADER,
+        query_string={'page': 5},
+    )
+
+    assert rv.status_code == 200, rv.data
+    assert rv.json == {'data': [], 'next_cursor': None, 'total': 3}
+
+
+def test_list_clusters_strict_loads(client, mocker, region, project, product):
+    raiseload = mocker.patch('sqlalchemy.orm.raiseload')
+    client.application.config['RHUB_STRICT_LOADS'] = True
+
+    q = model.Cluster.query.outerjoin.return_value.filter.return_value
+    q = q.options.return_value.add_columns.return_value
+    q.order_by.return_value.limit.return_value.offset.return_value.all.return_value = []
+
+    rv = client.get(
+        f'{API_BASE}/lab/cluster',
+        headers=AUTH_HEADER,
+    )
+
+    assert rv.status_code == 200, rv.data
+    raiseload.assert_called_with('*')
+    assert (
+        model.Cluster.query.outerjoin.return_value.filter.return_value
+        .options.call_args.args[-1]
+    ) is raiseload.return_value
+
+
+# Overrides the autouse fixture that mocks `_cluster_href`.
+@pytest.mark.parametrize('_cluster_href', [None])
+def test_list_clusters_eager_loads(client, mocker, region, project, product, _cluster_href):
+    """
+    Relationships used by `Cluster.to_dict()` and `_cluster_href()` must be
+    eager loaded in `list_clusters`, or each listed cluster triggers lazy
+    loads.
+    """
+    from rhub.api.lab.cluster import _CLUSTER_LIST_LOADS
+    from rhub.api.lab.cluster import _cluster_href as cluster_href
+
+    region.user_quota = model.Quota(num_vcpus=1, ram_mb=1, num_volumes=1, volumes_gb=1)
+    cluster = model.Cluster(
+        id=1,
+        name='testcluster',
+        region_id=region.id,
+        region=region,
+        project_id=project.id,
+        project=project,
+        status=model.ClusterStatus.ACTIVE,
+        product_id=product.id,
+        product=product,
+        product_params={},
+        hosts=[model.ClusterHost(id=1, cluster_id=1, fqdn='host0.example.com')],
+    )
+
+    # Replace relationship attributes by properties that record the path of
+    # accessed relationships from the cluster.
+    paths = {id(cluster): ()}
+    accessed = set()
+
+    def tracking_property(key):
+        def getter(obj):
+            path = paths.get(id(obj), ('?',)) + (key,)
+            accessed.add(path)
+            value = obj.__dict__.get(key)
+            for item in value if isinstance(value, list) else [value]:
+                paths[id(item)] = path
+            return value
+        return property(getter)
+
+    for cls in [model.Cluster, model.Region, model.Quota, model.Product,
+                model.ClusterHost, openstack_model.Project, auth_model.User,
+                auth_model.Group]:
+        for rel in sqlalchemy.inspect(cls).relationships:
+            mocker.patch.object(cls, rel.key, tracking_property(rel.key))
+
+    with client.application.test_request_context(f'{API_BASE}/lab/cluster'):
+        cluster.to_dict(list_view=True)
+        cluster_href(cluster)
+
+    loaded = set()
+    for option in _CLUSTER_LIST_LOADS:
+        path = tuple(attr.key for attr in option.path)
+        loaded.update(path[:i] for i in range(1, len(path) + 1))
+
+    assert accessed
+    assert accessed <= loaded, accessed - loaded
+
+
+@pytest.mark.parametrize(
+    'sort, cursor',
+    [
+        pytest.param('name', 'invalid', id='invalid'),
+        pytest.param('name', base64.urlsafe_b64encode(b'[1]').decode(), id='not-object'),
+        pytest.param(
+            'name', base64.urlsafe_b64encode(b'{"sort":"-name","id":1}').decode(),
+            id='different-sort',
+        ),
+        pytest.param(
+            'name', base64.urlsafe_b64encode(b'{"sort":"name","id":true,"value":"a"}').decode(),
+            id='bool-id',
+        ),
+        pytest.param(
+            'name', base64.urlsafe_b64encode(b'{"sort":"name","id":1,"value":{}}').decode(),
+            id='object-value',
+        ),
+        pytest.param(
+            'name', base64.urlsafe_b64encode(b'{"sort":"name","id":1,"value":null}').decode(),
+            id='null-not-nullable',
+        ),
+        pytest.param(
+            'reservation_expiration',
+            base64.urlsafe_b64encode(
+                b'{"sort":"reservation_expiration","id":1,"value":1}'
+            ).decode(),
+            id='number-date',
+        ),
+        pytest.param(
+            'reservation_expiration',
+            base64.urlsafe_b64encode(
+                b'{"sort":"reservation_expiration","id":1,"value":"x"}'
+            ).decode(),
+            id='invalid-date',
+        ),
+    ],
+)
+def test_list_clusters_invalid_cursor(client, sort, cursor):
+    rv = client.get(
+        f'{API_BASE}/lab/cluster',
+        headers=AUTH_HEADER,
+        query_string={'sort': sort, 'cursor': cursor},
+    )
+
+    assert rv.status_code == 400, rv.data
+
+
+@pytest.mark.parametrize(
+    'value, descending, expected',
+    [
+        pytest.param(
+            'x', False,
+            '(lab_cluster.reservation_expiration, lab_cluster.id) > (%(param_1)s, %(param_2)s) '
+            'OR lab_cluster.reservation_expiration IS NULL',
+            id='asc',
+        ),
+        pytest.param(
+            'x', True,
+            '(lab_cluster.reservation_expiration, lab_cluster.id) < (%(param_1)s, %(param_2)s)',
+            id='desc',
+        ),
+        pytest.param(
+            None, False,
+            'lab_cluster.reservation_expiration IS NULL AND lab_cluster.id > %(id_1)s',
+            id='asc-null',
+        ),
+        pytest.param(
+            None, True,
+            'lab_cluster.reservation_expiration IS NULL AND lab_cluster.id < %(id_1)s '
+            'OR lab_cluster.reservation_expiration IS NOT NULL',
+            id='desc-null',
+        ),
+    ],
+)
+def test_keyset_after(value, descending, expected):
+    from rhub.api.lab.cluster import _keyset_after
+
+    condition = _keyset_after(
+        (model.Cluster.reservation_expiration, model.Cluster.id),
+        (value, 1),
+        descending,
+    )
+
+    assert str(condition.compile(dialect=sqlalchemy.dialects.postgresql.dialect())) == expected
+
+
 def test_list_clusters_unauthorized(client):
     rv = client.get(
         f'{API_BASE}/lab/cluster',
@@ -579,7 +861,7 @@ def test_get_cluster_unauthorized(client):
 
 
 def test_create_cluster(client, db_session_mock, mocker,
-                        region, project, product, tower_client):
+                        region, project, product, lab_tasks_mock):
     cluster_data = {
         'name': 'testcluster',
         'description': 'test cluster',
@@ -590,7 +872,7 @@ def test_create_cluster(client, db_session_mock, mocker,
         'product_params': {},
     }
 
-    model.Cluster.query.filter.return_value.count.return_value = 0
+    db_session_mock.query.return_value.scalar.return_value = False
 
     def db_add(row):
         row.id = 1
@@ -601,9 +883,6 @@ def test_create_cluster(client, db_session_mock, mocker,
 
     db_session_mock.add.side_effect = db_add
 
-    tower_client.template_get.return_value = {'id': 123, 'name': 'dummy-create'}
-    tower_client.template_launch.return_value = {'id': 321}
-
     rv = client.post(
         f'{API_BASE}/lab/cluster',
         headers=AUTH_HEADER,
@@ -612,22 +891,9 @@ def test_create_cluster(client, db_session_mock, mocker,
 
     assert rv.status_code == 200, rv.data
 
-    region.tower.create_tower_client.assert_called()
-    tower_client.template_get.assert_called_with(template_name='dummy-create')
-    tower_client.template_launch.assert_called_with(123, {
-        'extra_vars': {
-            'rhub_cluster_id': 1,
-            'rhub_cluster_name': 'testcluster',
-            'rhub_product_id': product.id,
-            'rhub_product_name': product.name,
-            'rhub_region_id': region.id,
-            'rhub_region_name': region.name,
-            'rhub_project_id': project.id,
-            'rhub_project_name': project.name,
-            'rhub_user_id': project.owner_id,
-            'rhub_user_name': project.owner.name,
-        },
-    })
+    lab_tasks_mock.launch_cluster_create.apply_async.assert_called_with(
+        (1, 1), priority=lab_tasks.LAUNCH_CLUSTER_CREATE_PRIORITY,
+    )
 
     db_session_mock.add.assert_called()
     db_session_mock.commit.assert_called()
@@ -636,17 +902,13 @@ def test_create_cluster(client, db_session_mock, mocker,
     for k, v in cluster_data.items():
         assert getattr(cluster, k) == v, k
 
-    cluster_event = db_session_mock.add.call_args_list[1].args[0]
-    assert cluster_event.cluster_id == 1
-    assert cluster_event.tower_job_id == 321
-
     assert rv.json['owner_id'] == project.owner_id
     assert rv.json['status'] == model.ClusterStatus.QUEUED.value
     assert rv.json['created'] == '2021-01-01T01:00:00+00:00'
 
 
 def test_create_cluster_shared(client, db_session_mock, mocker,
-                               region, shared_project, product, tower_client):
+                               region, shared_project, product, lab_tasks_mock):
     cluster_data = {
         'name': 'testsharedcluster',
         'description': 'test shared cluster',
@@ -656,7 +918,7 @@ def test_create_cluster_shared(client, db_session_mock, mocker,
         'product_params': {},
     }
 
-    model.Cluster.query.filter.return_value.count.return_value = 0
+    db_session_mock.query.return_value.scalar.return_value = False
 
     def db_add(row):
         row.id = 1
@@ -667,9 +929,6 @@ def test_create_cluster_shared(client, db_session_mock, mocker,
 
     db_session_mock.add.side_effect = db_add
 
-    tower_client.template_get.return_value = {'id': 123, 'name': 'dummy-create'}
-    tower_client.template_launch.return_value = {'id': 321}
-
     rv = client.post(
         f'{API_BASE}/lab/cluster',
         headers=AUTH_HEADER,
@@ -678,22 +937,9 @@ def test_create_cluster_shared(client, db_session_mock, mocker,
 
     assert rv.status_code == 200, rv.data
 
-    region.tower.create_tower_client.assert_called()
-    tower_client.template_get.assert_called_with(template_name='dummy-create')
-    tower_client.template_launch.assert_called_with(123, {
-        'extra_vars': {
-            'rhub_cluster_id': 1,
-            'rhub_cluster_name': 'testsharedcluster',
-            'rhub_product_id': product.id,
-            'rhub_product_name': product.name,
-            'rhub_region_id': region.id,
-            'rhub_region_name': region.name,
-            'rhub_project_id': shared_project.id,
-            'rhub_project_name': shared_project.name,
-            'rhub_user_id': shared_project.owner_id,
-            'rhub_user_name': shared_project.group.name,
-        },
-    })
+    lab_tasks_mock.launch_cluster_create.apply_async.assert_called_with(
+        (1, 1), priority=lab_tasks.LAUNCH_CLUSTER_CREATE_PRIORITY,
+    )
 
     db_session_mock.add.assert_called()
     db_session_mock.commit.assert_called()
@@ -702,10 +948,6 @@ def test_create_cluster_shared(client, db_session_mock, mocker,
     for k, v in cluster_data.items():
         assert getattr(cluster, k) == v
 
-    cluster_event = db_session_mock.add.call_args_list[1].args[0]
-    assert cluster_event.cluster_id == 1
-    assert cluster_event.tower_job_id == 321
-
     assert rv.json['owner_id'] == shared_project.owner_id
     assert rv.json['group_id'] == shared_project.group_id
 
@@ -714,11 +956,56 @@ def test_create_cluster_shared(client, db_session_mock, mocker,
     assert rv.json['lifespan_expiration'] is None
 
 
+def test_create_cluster_dispatch_error(client, db_session_mock, mocker, di_mock,
+                                      messaging_mock, region, project, product,
+                                      lab_tasks_mock):
+    cluster_data = {
+        'name': 'testcluster',
+        'region_id': 1,
+        'reservation_expiration': datetime.datetime(2100, 1, 1, 0, 0, tzinfo=tzutc()),
+        'product_id': 1,
+        'product_params': {},
+    }
+
+    db_session_mock.query.return_value.scalar.return_value = False
+
+    def db_add(row):
+        row.id = 1
+        if isinstance(row, model.Cluster):
+            mocker.patch.object(model.Cluster, 'region', region)
+            mocker.patch.object(model.Cluster, 'product', product)
+            mocker.patch.object(model.Cluster, 'project', project)
+
+    db_session_mock.add.side_effect = db_add
+
+    mocker.patch('rhub.lab.utils.di', new=di_mock)
+    lab_tasks_mock.launch_cluster_create.apply_async.side_effect = Exception('broker down')
+
+    rv = client.post(
+        f'{API_BASE}/lab/cluster',
+        headers=AUTH_HEADER,
+        json=cluster_data,
+    )
+
+    assert rv.status_code == 500, rv.data
+
+    cluster = db_session_mock.add.call_args_list[0].args[0]
+    assert cluster.status == model.ClusterStatus.CREATE_FAILED
+    db_session_mock.commit.assert_called()
+
+    cluster_event = db_session_mock.add.call_args_list[-1].args[0]
+    assert isinstance(cluster_event, model.ClusterStatusChangeEvent)
+    assert cluster_event.old_value == model.ClusterStatus.QUEUED
+    assert cluster_event.new_value == model.ClusterStatus.CREATE_FAILED
+
+    messaging_mock.send.assert_called_with('lab.cluster.create', ANY, extra=ANY)
+
+
 def test_create_cluster_in_disabled_region(client, db_session_mock, mocker,
                                            region, project):
     region.enabled = False
 
-    model.Cluster.query.filter.return_value.count.return_value = 0
+    db_session_mock.query.return_value.scalar.return_value = False
 
     cluster_data = {
         'name': 'testcluster',
@@ -747,8 +1034,8 @@ def test_create_cluster_in_disabled_region(client, db_session_mock, mocker,
         pytest.param('all'),
     ]
 )
-def test_create_cluster_invalid_name(client, cluster_name, mocker, region, project):
-    model.Cluster.query.filter.return_value.count.return_value = 0
+def test_create_cluster_invalid_name(client, db_session_mock, cluster_name, mocker, region, project):
+    db_session_mock.query.return_value.scalar.return_value = False
 
     rv = client.post(
         f'{API_BASE}/lab/cluster',
@@ -765,10 +1052,10 @@ def test_create_cluster_invalid_name(client, cluster_name, mocker, region, proje
     assert rv.status_code == 400
 
 
-def test_create_cluster_exceeded_reservation(client, mocker, region, project):
+def test_create_cluster_exceeded_reservation(client, db_session_mock, mocker, region, project):
     region.reservation_expiration_max = 1
 
-    model.Cluster.query.filter.return_value.count.return_value = 0
+    db_session_mock.query.return_value.scalar.return_value = False
 
     rv = client.post(
         f'{API_BASE}/lab/cluster',
@@ -786,12 +1073,12 @@ def test_create_cluster_exceeded_reservation(client, mocker, region, project):
     assert rv.json['detail'] == 'Exceeded maximal reservation time.'
 
 
-def test_create_cluster_set_lifespan_forbidden(client, mocker, region, project):
+def test_create_cluster_set_lifespan_forbidden(client, db_session_mock, mocker, region, project):
     mocker.patch('rhub.api.lab.cluster._user_can_set_lifespan').return_value = False
 
     region.lifespan_length = 30
 
-    model.Cluster.query.filter.return_value.count.return_value = 0
+    db_session_mock.query.return_value.scalar.return_value = False
 
     rv = client.post(
         f'{API_BASE}/lab/cluster',
@@ -833,7 +1120,7 @@ def test_create_cluster_with_disabled_product(
         'product_params': {},
     }
 
-    model.Cluster.query.filter.return_value.count.return_value = 0
+    db_session_mock.query.return_value.scalar.return_value = False
 
     rv = client.post(
         f'{API_BASE}/lab/cluster',
@@ -870,7 +1157,7 @@ def test_create_cluster_with_disabled_product_in_region(
         'product_params': {},
     }
 
-    model.Cluster.query.filter.return_value.count.return_value = 0
+    db_session_mock.query.return_value.scalar.return_value = False
 
     rv = client.post(
         f'{API_BASE}/lab/cluster',
@@ -906,7 +1193,7 @@ def test_create_cluster_quota(
         },
     }
 
-    model.Cluster.query.filter.return_value.count.return_value = 0
+    db_session_mock.query.return_value.scalar.return_value = False
 
     region_user_quota_id = 1
     region.user_quota = model.Quota(
@@ -965,7 +1252,7 @@ def test_create_cluster_default_expirations(
         'product_params': {},
     }
 
-    model.Cluster.query.filter.return_value.count.return_value = 0
+    db_session_mock.query.return_value.scalar.return_value = False
 
     def db_add(row):
         row.id = 1
@@ -1013,7 +1300,7 @@ def test_create_cluster_invalid_expirations(
     region.lifespan_length = 7
     mocker.patch('rhub.api.lab.cluster._user_can_set_lifespan').return_value = True
 
-    model.Cluster.query.filter.return_value.count.return_value = 0
+    db_session_mock.query.return_value.scalar.return_value = False
 
     tower_client.template_get.return_value = {'id': 123, 'name': 'dummy-create'}
 
@@ -1038,7 +1325,7 @@ def test_create_cluster_existing_name(client, db_session_mock):
         'product_params': {},
     }
 
-    model.Cluster.query.filter.return_value.count.return_value = 1
+    db_session_mock.query.return_value.scalar.return_value = True
 
     rv = client.post(
         f'{API_BASE}/lab/cluster',
@@ -1399,7 +1686,7 @@ def test_update_cluster_status(client, db_session_mock, di_mock, messaging_mock,
 
 
 def test_update_cluster_extra(client, db_session_mock, di_mock, messaging_mock, mocker,
-                              region, project, product):
+                              date_now_mock, region, project, product):
     cluster = model.Cluster(
         id=1,
         name='testcluster',
@@ -1444,6 +1731,8 @@ def test_update_cluster_extra(client, db_session_mock, di_mock, messaging_mock,
     assert event.status == model.ClusterStatus.ACTIVE
     assert event.tower_id == region.tower_id
     assert event.tower_job_id == 1234
+    assert event.date == date_now_mock.return_value
+    date_now_mock.assert_called_once()
 
     messaging_mock.send.assert_called_with('lab.cluster.update', ANY, extra=ANY)
 
@@ -1718,10 +2007,18 @@ def test_get_cluster_events(client, mocker, project, shared_project, auth_user,
         reservation_expiration=None,
         lifespan_expiration=None,
         status=model.ClusterStatus.ACTIVE,
-        events=events,
     )
     model.Cluster.query.get.return_value = cluster
 
+    q = model.ClusterEvent.query.filter.return_value.options.return_value
+    q.add_columns.return_value.order_by.return_value.limit.return_value.offset.return_value.all.return_value = [
+        (i, 2) for i in events
+    ]
+
+    create_tower_client = mocker.patch.object(tower_model.Server, 'create_tower_client')
+    raiseload = mocker.patch('sqlalchemy.orm.raiseload')
+    client.application.config['RHUB_STRICT_LOADS'] = True
+
     rv = client.get(
         f'{API_BASE}/lab/cluster/1/events',
         headers=AUTH_HEADER,
@@ -1730,8 +2027,21 @@ def test_get_cluster_events(client, mocker, project, shared_project, auth_user,
     assert rv.status_code == 200
 
     model.Cluster.query.get.assert_called_with(1)
+    # No Tower requests (job output) per event in the list.
+    create_tower_client.assert_not_called()
+    # Lazy loads of event relationships are forbidden.
+    raiseload.assert_called_with('*')
+    assert model.ClusterEvent.query.filter.return_value.options.call_args.args[-1] is (
+        raiseload.return_value
+    )
 
-    assert rv.json == [
+    q.add_columns.return_value.order_by.return_value.limit.assert_called_with(
+        DEFAULT_PAGE_LIMIT + 1,
+    )
+
+    assert rv.json['total'] == 2
+    assert rv.json['next_cursor'] is None
+    assert rv.json['data'] == [
         {
             'id': 1,
             'type': model.ClusterEventType.TOWER_JOB.value,
@@ -1758,6 +2068,97 @@ def test_get_cluster_events(client, mocker, project, shared_project, auth_user,
     ]
 
 
+def test_list_cluster_events_loads_subclass_columns(client, mocker):
+    """
+    Columns of event subclasses used by `ClusterEvent.to_dict()` and
+    `_cluster_event_href()` must be selected by `ClusterEvent` queries, or each
+    listed event triggers another query to load them.
+    """
+    from rhub.api.lab.cluster import _cluster_event_href
+
+    events = [
+        model.ClusterTowerJobEvent(
+            id=1, cluster_id=1, tower_id=1, tower_job_id=1,
+            status=model.ClusterStatus.ACTIVE,
+        ),
+        model.ClusterStatusChangeEvent(
+            id=2, cluster_id=1,
+            old_value=model.ClusterStatus.QUEUED,
+            new_value=model.ClusterStatus.ACTIVE,
+        ),
+        model.ClusterReservationChangeEvent(id=3, cluster_id=1),
+        model.ClusterLifespanChangeEvent(id=4, cluster_id=1),
+    ]
+
+    # Replace column attributes by properties that record names of accessed
+    # columns.
+    accessed = set()
+
+    def tracking_property(key, column_name):
+        def getter(obj):
+            accessed.add(column_name)
+            return obj.__dict__.get(key)
+        return property(getter)
+
+    for cls in {type(i) for i in events} | {model.ClusterEvent}:
+        for attr in sqlalchemy.inspect(cls).column_attrs:
+            if attr.key in cls.__dict__:
+                mocker.patch.object(
+                    cls, attr.key, tracking_property(attr.key, attr.columns[0].name),
+                )
+
+    with client.application.test_request_context(f'{API_BASE}/lab/cluster/1/events'):
+        for event in events:
+            event.to_dict()
+            _cluster_event_href(event)
+
+    query = sqlalchemy.orm.Query(model.ClusterEvent)
+    loaded = {c.name for c in query.statement.selected_columns}
+
+    assert {'tower_job_id', 'status_old', 'expiration_new'} <= accessed
+    assert accessed <= loaded, accessed - loaded
+
+
+def test_get_cluster_events_cursor(client, mocker, project):
+    mocker.patch('rhub.api.lab.cluster._user_can_access_cluster').return_value = True
+
+    events = [
+        model.ClusterReservationChangeEvent(
+            id=i,
+            date=datetime.datetime(2021, 1, 1, i, 0, 0, tzinfo=tzutc()),
+            cluster_id=1,
+            old_value=None,
+            new_value=None,
+        )
+        for i in (3, 2, 1)
+    ]
+    model.Cluster.query.get.return_value = model.Cluster(
+        id=1,
+        project_id=project.id,
+        project=project,
+    )
+
+    q = model.ClusterEvent.query.filter.return_value.options.return_value
+    q.order_by.return_value.filter.return_value.limit.return_value.all.return_value = events
+
+    cursor = base64.urlsafe_b64encode(
+        b'{"sort":"-date","value":"2021-01-01T04:00:00+00:00","id":4}'
+    )
+    rv = client.get(
+        f'{API_BASE}/lab/cluster/1/events',
+        headers=AUTH_HEADER,
+        query_string={'limit': 2, 'cursor': cursor.decode()},
+    )
+
+    assert rv.status_code == 200, rv.data
+    assert [i['id'] for i in rv.json['data']] == [3, 2]
+    assert 'total' not in rv.json
+    assert base64.urlsafe_b64decode(rv.json['next_cursor']) == (
+        b'{"sort":"-date","id":2,"value":"2021-01-01T02:00:00+00:00"}'
+    )
+    q.order_by.return_value.filter.return_value.limit.assert_called_with(3)
+
+
 def test_get_cluster_events_forbidden(client, mocker, region, project, product):
     cluster_id = 1
 
@@ -1819,6 +2220,65 @@ def test_get_cluster_events_unauthorized(client):
     assert rv.json['detail'] == 'No authorization token provided'
 
 
+def test_url_template_script_root(client):
+    from rhub.api.lab.cluster import _url
+
+    for script_root in ['', '/prefix', '']:
+        with client.application.test_request_context(
+            f'{API_BASE}/lab/cluster', base_url=f'http://localhost{script_root}',
+        ):
+            assert _url('.rhub_api_lab_cluster_get_cluster', 'cluster_id', 1) == (
+                f'{script_root}{API_BASE}/lab/cluster/1'
+            )
+
+
+def test_cluster_event_href(client):
+    from rhub.api.lab.cluster import _cluster_event_href
+
+    event = model.ClusterTowerJobEvent(
+        id=2,
+        cluster_id=1,
+        user_id=3,
+        tower_id=4,
+        tower_job_id=5,
+    )
+
+    with client.application.test_request_context(f'{API_BASE}/lab/cluster/1/events'):
+        assert _cluster_event_href(event) == {
+            'cluster': f'{API_BASE}/lab/cluster/1',
+            'event': f'{API_BASE}/lab/cluster_event/2',
+            'user': f'{API_BASE}/auth/user/3',
+            'tower': f'{API_BASE}/tower/server/4',
+            'event_stdout': f'{API_BASE}/lab/cluster_event/2/stdout',
+        }
+
+    event = model.ClusterReservationChangeEvent(
+        id=6,
+        cluster_id=1,
+        user_id=None,
+    )
+
+    with client.application.test_request_context(f'{API_BASE}/lab/cluster/1/events'):
+        assert _cluster_event_href(event) == {
+            'cluster': f'{API_BASE}/lab/cluster/1',
+            'event': f'{API_BASE}/lab/cluster_event/6',
+        }
+
+    # Type set as plain string, e.g. from dict.
+    event = model.ClusterTowerJobEvent(
+        id=7,
+        type='tower_job',
+        cluster_id=1,
+        tower_id=4,
+        tower_job_id=5,
+    )
+
+    with client.application.test_request_context(f'{API_BASE}/lab/cluster/1/events'):
+        assert _cluster_event_href(event)['event_stdout'] == (
+            f'{API_BASE}/lab/cluster_event/7/stdout'
+        )
+
+
 def test_get_cluster_event_stdout(client, mocker):
     event = model.ClusterTowerJobEvent(
         id=1,
@@ -1952,6 +2412,29 @@ def test_get_cluster_hosts(mocker, client, project, shared_project, is_shared, i
         lambda cluster, user_id: is_admin or cluster.owner_id == user_id
     )
 
+    hosts = [
+        model.ClusterHost(
+            id=1,
+            cluster_id=1,
+            fqdn='host0.example.com',
+            ipaddr=['1.2.3.4'],
+            num_vcpus=2,
+            ram_mb=2048,
+            num_volumes=3,
+            volumes_gb=30,
+        ),
+        model.ClusterHost(
+            id=2,
+            cluster_id=1,
+            fqdn='host1.example.com',
+            ipaddr=['1:2::3:4'],
+            num_vcpus=2,
+            ram_mb=2048,
+            num_volumes=3,
+            volumes_gb=30,
+        ),
+    ]
+
     model.Cluster.query.get.return_value = model.Cluster(
         id=1,
         name='testcluster',
@@ -1963,30 +2446,13 @@ def test_get_cluster_hosts(mocker, client, project, shared_project, is_shared, i
         reservation_expiration=None,
         lifespan_expiration=None,
         status=model.ClusterStatus.ACTIVE,
-        hosts=[
-            model.ClusterHost(
-                id=1,
-                cluster_id=1,
-                fqdn='host0.example.com',
-                ipaddr=['1.2.3.4'],
-                num_vcpus=2,
-                ram_mb=2048,
-                num_volumes=3,
-                volumes_gb=30,
-            ),
-            model.ClusterHost(
-                id=2,
-                cluster_id=1,
-                fqdn='host1.example.com',
-                ipaddr=['1:2::3:4'],
-                num_vcpus=2,
-                ram_mb=2048,
-                num_volumes=3,
-                volumes_gb=30,
-            ),
-        ],
     )
 
+    q = model.ClusterHost.query.filter.return_value.options.return_value
+    q.add_columns.return_value.order_by.return_value.limit.return_value.offset.return_value.all.return_value = [
+        (i, 2) for i in hosts
+    ]
+
     rv = client.get(
         f'{API_BASE}/lab/cluster/1/hosts',
         headers=AUTH_HEADER,
@@ -1996,7 +2462,9 @@ def test_get_cluster_hosts(mocker, client, project, shared_project, is_shared, i
 
     model.Cluster.query.get.assert_called_with(1)
 
-    assert rv.json == [
+    assert rv.json['total'] == 2
+    assert rv.json['next_cursor'] is None
+    assert rv.json['data'] == [
         {
             'id': 1,
             'cluster_id': 1,
@@ -2120,10 +2588,12 @@ def test_create_cluster_hosts(client, db_session_mock, project):
 
     assert rv.status_code == 200
 
-    db_session_mock.add.assert_called()
+    db_session_mock.add_all.assert_called_once()
+    db_session_mock.flush.assert_called_once()
     db_session_mock.commit.assert_called()
 
-    hosts = [i.args[0] for i in db_session_mock.add.call_args_list]
+    hosts = db_session_mock.add_all.call_args.args[0]
+    assert len(hosts) == len(hosts_data)
     for host_data, host_row in zip(hosts_data, hosts):
         for k, v in host_data.items():
             assert getattr(host_row, k) == v
@@ -2201,20 +2671,6 @@ def test_create_cluster_hosts_unauthorized(client, db_session_mock):
 
 
 def test_delete_cluster_hosts(client, db_session_mock, project):
-    hosts = [
-        model.ClusterHost(
-            id=1,
-            cluster_id=1,
-            fqdn='host0.example.com',
-            ipaddr=['1.2.3.4'],
-        ),
-        model.ClusterHost(
-            id=2,
-            cluster_id=1,
-            fqdn='host1.example.com',
-            ipaddr=['1:2::3:4'],
-        ),
-    ]
     cluster = model.Cluster(
         id=1,
         name='testcluster',
@@ -2226,9 +2682,9 @@ def test_delete_cluster_hosts(client, db_session_mock, project):
         reservation_expiration=None,
         lifespan_expiration=None,
         status=model.ClusterStatus.ACTIVE,
-        hosts=hosts,
     )
     model.Cluster.query.get.return_value = cluster
+    model.ClusterHost.query.filter.return_value.delete.return_value = 2
 
     rv = client.delete(
         f'{API_BASE}/lab/cluster/1/hosts',
@@ -2237,8 +2693,10 @@ def test_delete_cluster_hosts(client, db_session_mock, project):
 
     assert rv.status_code == 204
 
-    for host in hosts:
-        db_session_mock.delete.assert_any_call(host)
+    model.ClusterHost.query.filter.return_value.delete.assert_called_with(
+        synchronize_session=False,
+    )
+    db_session_mock.delete.assert_not_called()
     db_session_mock.commit.assert_called()
 
 
@@ -2271,6 +2729,165 @@ def test_delete_cluster_hosts_unauthorized(client, db_session_mock):
     assert rv.json['detail'] == 'No authorization token provided'
 
 
+@pytest.fixture
+def cluster_with_hosts(mocker, project):
+    hosts = [
+        model.ClusterHost(id=1, cluster_id=1, fqdn='host0.example.com'),
+        model.ClusterHost(id=2, cluster_id=1, fqdn='host1.example.com'),
+    ]
+    cluster = model.Cluster(
+        id=1,
+        name='testcluster',
+        description='test cluster',
+        created=datetime.datetime(2021, 1, 1, 1, 0, 0, tzinfo=tzutc()),
+        region_id=1,
+        project_id=project.id,
+        project=project,
+        reservation_expiration=None,
+        lifespan_expiration=None,
+        status=model.ClusterStatus.ACTIVE,
+        hosts=hosts,
+    )
+    model.Cluster.query.get.return_value = cluster
+    yield cluster
+
+
+@pytest.fixture
+def os_client(mocker):
+    os_client = mocker.Mock()
+    mocker.patch.object(openstack_model.Project, 'create_openstack_client').return_value = os_client
+    yield os_client
+
+
+def test_reboot_hosts_all(client, mocker, cluster_with_hosts, os_client):
+    servers = [
+        mocker.Mock(hostname='host0.example.com'),
+        mocker.Mock(hostname='host1.example.com'),
+        mocker.Mock(hostname='other.example.com'),
+    ]
+    os_client.compute.servers.return_value = servers
+
+    rv = client.post(
+        f'{API_BASE}/lab/cluster/1/reboot',
+        headers=AUTH_HEADER,
+        json={'hosts': 'all', 'type': 'hard'},
+    )
+
+    assert rv.status_code == 200, rv.data
+    assert rv.json == [
+        {'id': 1, 'fqdn': 'host0.example.com'},
+        {'id': 2, 'fqdn': 'host1.example.com'},
+    ]
+    os_client.compute.servers.assert_called_with(
+        hostname=r'^(host0\.example\.com|host1\.example\.com)$',
+    )
+    assert os_client.compute.reboot_server.call_count == 2
+    os_client.compute.reboot_server.assert_any_call(servers[0], 'HARD')
+    os_client.compute.reboot_server.assert_any_call(servers[1], 'HARD')
+
+
+def test_reboot_hosts_all_large_cluster(client, mocker, cluster_with_hosts, os_client):
+    from rhub.api.lab.cluster import _REBOOT_HOSTNAME_BATCH
+
+    num_hosts = _REBOOT_HOSTNAME_BATCH * 2 + 1
+    cluster_with_hosts.hosts = [
+        model.ClusterHost(id=i, cluster_id=1, fqdn=f'host{i}.example.com')
+        for i in range(1, num_hosts + 1)
+    ]
+    servers = [
+        mocker.Mock(id=f'server{i}', hostname=f'host{i}.example.com')
+        for i in range(1, num_hosts + 1)
+    ]
+    # Hostname filter is ignored, all servers are returned for each request.
+    os_client.compute.servers.return_value = servers
+
+    rv = client.post(
+        f'{API_BASE}/lab/cluster/1/reboot',
+        headers=AUTH_HEADER,
+        json={'hosts': 'all'},
+    )
+
+    assert rv.status_code == 200, rv.data
+    assert len(rv.json) == num_hosts
+    assert os_client.compute.servers.call_count == 3
+    for call in os_client.compute.servers.call_args_list:
+        assert call.kwargs['hostname'].count('|') < _REBOOT_HOSTNAME_BATCH
+    assert os_client.compute.servers.call_args.kwargs['hostname'] == (
+        rf'^(host{num_hosts}\.example\.com)$'
+    )
+    assert os_client.compute.reboot_server.call_count == num_hosts
+
+
+def test_reboot_hosts_by_id_and_fqdn(client, mocker, cluster_with_hosts, os_client):
+    servers = [
+        mocker.Mock(hostname='host0.example.com'),
+        mocker.Mock(hostname='host1.example.com'),
+    ]
+    os_client.compute.servers.return_value = servers
+
+    model.ClusterHost.query.filter.reset_mock()
+    model.ClusterHost.query.filter.return_value.all.return_value = (
+        cluster_with_hosts.hosts
+    )
+
+    rv = client.post(
+        f'{API_BASE}/lab/cluster/1/reboot',
+        headers=AUTH_HEADER,
+        json={'hosts': [{'id': 1}, {'fqdn': 'host1.example.com'}]},
+    )
+
+    assert rv.status_code == 200, rv.data
+    assert rv.json == [
+        {'id': 1, 'fqdn': 'host0.example.com'},
+        {'id': 2, 'fqdn': 'host1.example.com'},
+    ]
+    model.ClusterHost.query.filter.assert_called_once()
+    criteria = model.ClusterHost.query.filter.call_args.args
+    assert str(criteria[1].compile()) == (
+        'lab_cluster_host.id IN (__[POSTCOMPILE_id_1]) '
+        'OR lab_cluster_host.fqdn IN (__[POSTCOMPILE_fqdn_1])'
+    )
+    os_client.compute.reboot_server.assert_any_call(servers[0], 'SOFT')
+    os_client.compute.reboot_server.assert_any_call(servers[1], 'SOFT')
+
+
+def test_reboot_hosts_by_id(client, mocker, cluster_with_hosts, os_client):
+    servers = [mocker.Mock(hostname='host0.example.com')]
+    os_client.compute.servers.return_value = servers
+
+    model.ClusterHost.query.filter.reset_mock()
+    model.ClusterHost.query.filter.return_value.all.return_value = (
+        cluster_with_hosts.hosts[:1]
+    )
+
+    rv = client.post(
+        f'{API_BASE}/lab/cluster/1/reboot',
+        headers=AUTH_HEADER,
+        json={'hosts': [{'id': 1}]},
+    )
+
+    assert rv.status_code == 200, rv.data
+    assert rv.json == [{'id': 1, 'fqdn': 'host0.example.com'}]
+    model.ClusterHost.query.filter.assert_called_once()
+    criteria = model.ClusterHost.query.filter.call_args.args
+    assert str(criteria[1].compile()) == 'lab_cluster_host.id IN (__[POSTCOMPILE_id_1])'
+    os_client.compute.reboot_server.assert_called_once_with(servers[0], 'SOFT')
+
+
+def test_reboot_hosts_no_match(client, cluster_with_hosts, os_client):
+    model.ClusterHost.query.filter.return_value.all.return_value = []
+
+    rv = client.post(
+        f'{API_BASE}/lab/cluster/1/reboot',
+        headers=AUTH_HEADER,
+        json={'hosts': [{'id': 10}]},
+    )
+
+    assert rv.status_code == 200, rv.data
+    assert rv.json == []
+    os_client.compute.servers.assert_not_called()
+
+
 def test_tower_webhook_cluster(
     client, mocker, messaging_mock, auth_user, region, project, product, tower_client,
     di_mock
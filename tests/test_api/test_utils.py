@@ -1,3 +1,4 @@
+import flask
 import pytest
 
 from rhub.api import utils
@@ -94,3 +95,50 @@ from rhub.api import utils
 )
 def test_condition_eval(condition, params, result):
     assert utils.condition_eval(condition, params) == result
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        {'id': 1},
+        {'sort': '-name', 'value': 'test', 'id': 10},
+        {'sort': 'reservation_expiration', 'value': None, 'id': 10},
+    ],
+)
+def test_cursor(data):
+    cursor = utils.cursor_encode(data)
+    assert utils.cursor_decode(cursor) == data
+
+
+@pytest.mark.parametrize('cursor', ['', 'invalid', 'WzFd'])
+def test_cursor_decode_invalid(cursor):
+    with pytest.raises(ValueError):
+        utils.cursor_decode(cursor)
+
+
+def test_request_cache():
+    calls = []
+
+    @utils.request_cache
+    def fn(x):
+        calls.append(x)
+        return x * 2
+
+    app = flask.Flask(__name__)
+
+    with app.test_request_context():
+        assert fn(1) == 2
+        assert fn(1) == 2
+        assert fn(2) == 4
+        assert calls == [1, 2]
+
+    with app.test_request_context():
+        assert fn(1) == 2
+        assert calls == [1, 2, 1]
+
+    # Not cached outside of request, app context may live as long as the
+    # process (Celery worker).
+    with app.app_context():
+        assert fn(1) == 2
+        assert fn(1) == 2
+        assert calls == [1, 2, 1, 1, 1]
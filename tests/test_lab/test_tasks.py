@@ -0,0 +1,115 @@
+import datetime
+from unittest.mock import ANY
+
+import pytest
+from dateutil.tz import tzutc
+
+from rhub.auth import model as auth_model
+from rhub.lab import model
+from rhub.lab import tasks as lab_tasks
+from rhub.openstack import model as openstack_model
+
+
+@pytest.fixture
+def cluster(mocker):
+    owner = auth_model.User(id=1, name='user')
+    region = model.Region(id=1, name='test', tower_id=1)
+    product = model.Product(
+        id=1,
+        name='dummy',
+        tower_template_name_create='dummy-create',
+        tower_template_name_delete='dummy-delete',
+        parameters=[],
+    )
+    project = openstack_model.Project(
+        id=1,
+        name='ql_user',
+        owner_id=owner.id,
+        owner=owner,
+    )
+    cluster = model.Cluster(
+        id=1,
+        name='testcluster',
+        created=datetime.datetime(2021, 1, 1, 1, 0, 0, tzinfo=tzutc()),
+        region_id=region.id,
+        region=region,
+        project_id=project.id,
+        project=project,
+        status=model.ClusterStatus.QUEUED,
+        product_id=product.id,
+        product=product,
+        product_params={},
+    )
+    model.Cluster.query.get.return_value = cluster
+    yield cluster
+
+
+@pytest.fixture
+def tower_client(mocker):
+    m = mocker.Mock()
+    mocker.patch.object(model.Region, 'tower')
+    model.Region.tower.create_tower_client.return_value = m
+    yield m
+
+
+def test_launch_cluster_create(cluster, tower_client, db_session_mock):
+    tower_client.template_get.return_value = {'id': 123, 'name': 'dummy-create'}
+    tower_client.template_launch.return_value = {'id': 321}
+
+    lab_tasks.launch_cluster_create.run(1, 1)
+
+    model.Cluster.query.get.assert_called_with(1)
+    tower_client.template_get.assert_called_with(template_name='dummy-create')
+    tower_client.template_launch.assert_called_with(123, {
+        'extra_vars': {
+            'rhub_cluster_id': 1,
+            'rhub_cluster_name': 'testcluster',
+            'rhub_product_id': 1,
+            'rhub_product_name': 'dummy',
+            'rhub_region_id': 1,
+            'rhub_region_name': 'test',
+            'rhub_project_id': 1,
+            'rhub_project_name': 'ql_user',
+            'rhub_user_id': 1,
+            'rhub_user_name': 'user',
+        },
+    })
+
+    cluster_event = db_session_mock.add.call_args.args[0]
+    assert isinstance(cluster_event, model.ClusterTowerJobEvent)
+    assert cluster_event.cluster_id == 1
+    assert cluster_event.user_id == 1
+    assert cluster_event.tower_job_id == 321
+    assert cluster.status == model.ClusterStatus.QUEUED
+    db_session_mock.commit.assert_called()
+
+
+def test_launch_cluster_create_failed(cluster, tower_client, db_session_mock,
+                                      di_mock, messaging_mock, mocker):
+    mocker.patch('rhub.lab.utils.di', new=di_mock)
+
+    tower_client.template_get.side_effect = Exception('tower error')
+
+    lab_tasks.launch_cluster_create.run(1, 1)
+
+    db_session_mock.rollback.assert_called()
+    tower_client.template_launch.assert_not_called()
+
+    cluster_event = db_session_mock.add.call_args.args[0]
+    assert isinstance(cluster_event, model.ClusterStatusChangeEvent)
+    assert cluster_event.old_value == model.ClusterStatus.QUEUED
+    assert cluster_event.new_value == model.ClusterStatus.CREATE_FAILED
+    assert cluster.status == model.ClusterStatus.CREATE_FAILED
+    db_session_mock.commit.assert_called()
+
+    messaging_mock.send.assert_called_with('lab.cluster.create', ANY, extra=ANY)
+
+
+def test_launch_cluster_create_not_queued(cluster, tower_client, db_session_mock):
+    cluster.status = model.ClusterStatus.CREATE_FAILED
+
+    lab_tasks.launch_cluster_create.run(1, 1)
+
+    tower_client.template_launch.assert_not_called()
+    db_session_mock.add.assert_not_called()
+    assert cluster.status == model.ClusterStatus.CREATE_FAILED